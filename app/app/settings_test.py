@@ -0,0 +1,33 @@
+"""
+Django settings used when running the test suite.
+
+Run the tests with:
+    python manage.py test --settings=app.settings_test
+"""
+
+from app.settings import *  # noqa: F401,F403
+
+
+# Password hashing
+# The default PBKDF2 hasher is deliberately slow; tests never need that.
+
+PASSWORD_HASHERS = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]
+
+
+# Database
+# Keep the test database in memory so nothing touches the disk.
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": ":memory:",
+    }
+}
+
+
+# Migrations
+# Build the schema of the project apps straight from the models.
+
+MIGRATION_MODULES = {app: None for app in ("core", "user", "recipe")}
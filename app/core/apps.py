@@ -1,6 +1,23 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
 
 
 class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
+
+    def ready(self):
+        """Connect token cache invalidation to user and token changes"""
+
+        from rest_framework.authtoken.models import Token
+
+        from core.authentication import clear_token, clear_user_tokens
+
+        post_save.connect(clear_user_tokens, sender=settings.AUTH_USER_MODEL)
+        post_delete.connect(
+            clear_user_tokens,
+            sender=settings.AUTH_USER_MODEL,
+        )
+        post_save.connect(clear_token, sender=Token)
+        post_delete.connect(clear_token, sender=Token)
@@ -0,0 +1,134 @@
+"""
+Authentication for the APIs
+
+"""
+
+import hashlib
+import uuid
+
+from django.contrib.auth import get_user_model
+from django.core.cache import caches
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """Token authentication caching recent lookups in Django's cache
+
+    Saving or deleting a user or token invalidates its cached lookups in
+    the configured cache. Every worker sees that only when the cache
+    backend is shared (Redis, Memcached); the default local memory cache
+    is per process. Changes made with QuerySet.update() or raw SQL send no
+    signal, so they are picked up once the entry expires after cache_ttl
+    seconds.
+
+    Cached entries hold the user id and field values except the password;
+    neither the raw token key nor the password hash is stored.
+    """
+
+    cache_alias = "default"
+    cache_ttl = 30
+    uncached_user_fields = ("password",)
+
+    @classmethod
+    def get_cache(cls):
+        """Return the cache holding token lookups"""
+
+        return caches[cls.cache_alias]
+
+    @staticmethod
+    def _token_cache_key(key):
+        """Return the cache key for a raw token key"""
+
+        return "auth-token:" + hashlib.sha256(key.encode()).hexdigest()[:32]
+
+    @staticmethod
+    def _user_cache_key(user_id):
+        """Return the cache key of a user's current lookup stamp"""
+
+        return f"auth-token-user:{user_id}"
+
+    def _build_credentials(self, key, db, fields):
+        """Return user and token rebuilt from cached user fields"""
+
+        user = get_user_model().from_db(
+            db,
+            list(fields),
+            list(fields.values()),
+        )
+        token = self.get_model().from_db(
+            db,
+            ["key", "user_id"],
+            [key, user.pk],
+        )
+        token.user = user
+
+        return user, token
+
+    def authenticate_credentials(self, key):
+        """Return user and token, hitting the database on cache miss only"""
+
+        cache = self.get_cache()
+        token_cache_key = self._token_cache_key(key)
+
+        entry = cache.get(token_cache_key)
+        if entry is not None:
+            user_id, stamp, db, fields = entry
+            if cache.get(self._user_cache_key(user_id)) == stamp:
+                return self._build_credentials(key, db, fields)
+        else:
+            user_id = (
+                self.get_model()
+                .objects.filter(key=key)
+                .values_list("user_id", flat=True)
+                .first()
+            )
+            if user_id is None:
+                raise exceptions.AuthenticationFailed("Invalid token.")
+
+        # Take the stamp before reading, so an invalidation racing the read
+        # leaves the new entry with a stamp that no longer matches
+        stamp = cache.get_or_set(
+            self._user_cache_key(user_id),
+            uuid.uuid4().hex,
+            self.cache_ttl,
+        )
+
+        user, token = super().authenticate_credentials(key)
+
+        fields = {
+            field.attname: getattr(user, field.attname)
+            for field in user._meta.concrete_fields
+            if field.attname not in self.uncached_user_fields
+        }
+        cache.set(
+            token_cache_key,
+            (user.pk, stamp, user._state.db, fields),
+            self.cache_ttl,
+        )
+
+        return user, token
+
+    @classmethod
+    def invalidate_user(cls, user_id):
+        """Drop cached lookups of every token of a user"""
+
+        cls.get_cache().delete(cls._user_cache_key(user_id))
+
+    @classmethod
+    def invalidate_token(cls, key):
+        """Drop the cached lookup of a token"""
+
+        cls.get_cache().delete(cls._token_cache_key(key))
+
+
+def clear_user_tokens(sender, instance, **kwargs):
+    """Invalidate cached lookups when a user changes"""
+
+    CachedTokenAuthentication.invalidate_user(instance.pk)
+
+
+def clear_token(sender, instance, **kwargs):
+    """Invalidate the cached lookup of a changed or deleted token"""
+
+    CachedTokenAuthentication.invalidate_token(instance.key)
@@ -41,12 +41,12 @@ class UserManager(BaseUserManager):
     def create_superuser(self, email, password):
         """Create and return new superuser"""
 
-        user = self.create_user(email, password)
-        user.is_staff = True
-        user.is_superuser = True
-        user.save(using=self._db)
-
-        return user
+        return self.create_user(
+            email,
+            password,
+            is_staff=True,
+            is_superuser=True,
+        )
 
 
 class User(AbstractBaseUser, PermissionsMixin):
@@ -87,11 +87,16 @@ class Tag(models.Model):
     """Tag for filtering recipe"""
 
     name = models.CharField(max_length=255)
+    # Covered by the (user, name) index, so no separate user index
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
     )
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "name"])]
+
     def __str__(self):
         return self.name
 
@@ -100,10 +105,15 @@ class Ingredient(models.Model):
     """Ingredient for filtering recipe"""
 
     name = models.CharField(max_length=255)
+    # Covered by the (user, name) index, so no separate user index
     user = models.ForeignKey(
         settings.AUTH_USER_MODEL,
         on_delete=models.CASCADE,
+        db_index=False,
     )
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "name"])]
+
     def __str__(self):
         return self.name
@@ -3,32 +3,46 @@ Test for django admin modifications
 
 """
 
+from django.contrib import admin
 from django.test import TestCase
 from django.contrib.auth import get_user_model
 from django.urls import reverse
-from django.test import Client
+from django.test import RequestFactory
+
+from core.admin import UserAdmin
 
 
 class AdminSiteTests(TestCase):
     """Test for django admin"""
 
-    def setUp(self):
-        """Create user and client"""
-        self.client = Client()
-        self.admin_user = get_user_model().objects.create_superuser(
+    @classmethod
+    def setUpTestData(cls):
+        """Create users shared by every test in the class"""
+        cls.admin_user = get_user_model().objects.create_superuser(
             email="admin@example.com", password="admintest1234_"
         )
-        self.client.force_login(self.admin_user)
-        self.user = get_user_model().objects.create_user(
+        cls.user = get_user_model().objects.create_user(
             email="testuser@example.com",
             password="test1234_",
             name="Test User",
         )
 
+    def setUp(self):
+        """Create request factory and user admin"""
+        self.factory = RequestFactory()
+        self.user_admin = UserAdmin(get_user_model(), admin.site)
+
+    def _get(self, url):
+        """Build a GET request made by the admin user"""
+        request = self.factory.get(url)
+        request.user = self.admin_user
+
+        return request
+
     def test_user_list(self):
         """Test that users are listed on page"""
         url = reverse("admin:core_user_changelist")
-        response = self.client.get(url)
+        response = self.user_admin.changelist_view(self._get(url))
 
         self.assertContains(response, self.user.name)
         self.assertContains(response, self.user.email)
@@ -37,7 +51,10 @@ class AdminSiteTests(TestCase):
         """Test if the user edit page works"""
 
         url = reverse("admin:core_user_change", args=[self.user.id])
-        response = self.client.get(url)
+        response = self.user_admin.change_view(
+            self._get(url),
+            str(self.user.id),
+        )
 
         self.assertEqual(response.status_code, 200)
 
@@ -45,5 +62,5 @@ class AdminSiteTests(TestCase):
         """Test if user page works"""
 
         url = reverse("admin:core_user_add")
-        response = self.client.get(url)
+        response = self.user_admin.add_view(self._get(url))
         self.assertEqual(response.status_code, 200)
@@ -0,0 +1,117 @@
+"""
+Test for API authentication
+
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+from core.authentication import CachedTokenAuthentication
+
+
+class CachedTokenAuthenticationTests(TestCase):
+    """Test cached token authentication"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
+            email="user@example.com",
+            password="testpass1234_",
+        )
+
+    def setUp(self):
+        cache = CachedTokenAuthentication.get_cache()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.token = Token.objects.create(user=self.user)
+        self.auth = CachedTokenAuthentication()
+
+    def _authenticate(self):
+        """Authenticate a request carrying the test token"""
+        request = APIRequestFactory().get(
+            "/",
+            HTTP_AUTHORIZATION=f"Token {self.token.key}",
+        )
+
+        return self.auth.authenticate(request)
+
+    def test_lookup_is_cached(self):
+        """Test repeated authentication skips the database"""
+
+        with self.assertNumQueries(2):
+            self._authenticate()
+
+        with self.assertNumQueries(0):
+            user, token = self._authenticate()
+
+        self.assertEqual(user.pk, self.user.pk)
+        self.assertEqual(user.email, self.user.email)
+        self.assertEqual(token.key, self.token.key)
+
+    def test_user_change_invalidates_cache(self):
+        """Test deactivated user is rejected despite a cached lookup"""
+
+        self._authenticate()
+        self.user.is_active = False
+        self.user.save()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_deleted_token_invalidates_cache(self):
+        """Test deleted token is rejected despite a cached lookup"""
+
+        self._authenticate()
+        self.token.delete()
+
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_other_user_change_keeps_cache(self):
+        """Test changing another user keeps the cached lookup"""
+
+        self._authenticate()
+        get_user_model().objects.create_user(
+            email="other@example.com",
+            password="testpass1234_",
+        )
+
+        with self.assertNumQueries(0):
+            self._authenticate()
+
+    def test_cache_skips_secrets(self):
+        """Test cached entries hold neither the token nor password hash"""
+
+        self._authenticate()
+        entry = CachedTokenAuthentication.get_cache().get(
+            CachedTokenAuthentication._token_cache_key(self.token.key)
+        )
+
+        self.assertNotIn(self.token.key, repr(entry))
+        self.assertNotIn(self.user.password, repr(entry))
+
+    def test_invalidation_during_lookup(self):
+        """Test user change racing a lookup is not masked by the cache"""
+
+        lookup = TokenAuthentication.authenticate_credentials
+
+        def racing_lookup(auth, key):
+            credentials = lookup(auth, key)
+            CachedTokenAuthentication.invalidate_user(self.user.pk)
+            return credentials
+
+        with patch.object(
+            TokenAuthentication,
+            "authenticate_credentials",
+            racing_lookup,
+        ):
+            self._authenticate()
+
+        with self.assertNumQueries(1):
+            self._authenticate()
@@ -20,6 +20,10 @@ def create_user(email="user@example.com", password="testpass1234_"):
 class ModelTest(TestCase):
     """Test Model"""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.shared_user = create_user()
+
     def test_create_user_with_email_success(self):
         """Test use with an email is successful"""
         email = "test@example.com"
@@ -32,7 +36,16 @@ class ModelTest(TestCase):
             user.email,
             email,
         )
+        self.assertTrue(user.has_usable_password())
+        self.assertNotEqual(user.password, password)
+
+    def test_password_roundtrip(self):
+        """Test stored password can be checked against the raw one"""
+        password = "pa$$word123_"
+        user = create_user(email="roundtrip@example.com", password=password)
+
         self.assertTrue(user.check_password(password))
+        self.assertFalse(user.check_password("wrong-password"))
 
     def test_new_user_email_normalized(self):
         """Test use email is normalized"""
@@ -44,11 +57,12 @@ class ModelTest(TestCase):
         ]
 
         for email, expected_email in sample_emails:
-            user = get_user_model().objects.create_user(
-                email,
-                "sample123",
-            )
-            self.assertEqual(user.email, expected_email)
+            with self.subTest(email=email):
+                user = get_user_model().objects.create_user(
+                    email,
+                    "sample123",
+                )
+                self.assertEqual(user.email, expected_email)
 
     def test_new_user_without_email_raises_error(self):
         """Raises error when user does not provide email"""
@@ -68,12 +82,8 @@ class ModelTest(TestCase):
     def test_create_recipe(self):
         """Test create recipe is successful"""
 
-        user = get_user_model().objects.create_user(
-            email="test@example.com",
-            password="password123_",
-        )
         recipe = models.Recipe.objects.create(
-            user=user,
+            user=self.shared_user,
             title="Simple recipe title",
             time_minutes=5,
             price=Decimal("5.50"),
@@ -85,16 +95,14 @@ class ModelTest(TestCase):
     def test_create_tag(self):
         """Test create tag successful"""
 
-        user = create_user()
-        tag = models.Tag.objects.create(user=user, name="Tag1")
+        tag = models.Tag.objects.create(user=self.shared_user, name="Tag1")
 
         self.assertEqual(f"{tag}", tag.name)
 
     def test_create_ingredient(self):
         """Test create ingredient successful"""
-        user = create_user()
         ingredient = models.Ingredient.objects.create(
-            user=user,
+            user=self.shared_user,
             name="Ingredient1",
         )
 
@@ -49,32 +49,40 @@ class RecipeSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ["id"]
 
-    def _get_or_create_tags(self, tags, recipe):
-        """Handle getting or create tags as needed"""
+    def _get_or_create_attrs(self, model, attrs):
+        """Return objects for the given attrs, creating missing ones in bulk"""
 
         auth_user = self.context["request"].user
+        names = list(dict.fromkeys(attr["name"] for attr in attrs))
+
+        existing = {
+            obj.name: obj
+            for obj in model.objects.filter(user=auth_user, name__in=names)
+        }
+        missing = model.objects.bulk_create(
+            [
+                model(user=auth_user, name=name)
+                for name in names
+                if name not in existing
+            ]
+        )
+
+        return [*existing.values(), *missing]
 
-        for tag in tags:
-            tag_obj, created = Tag.objects.get_or_create(
-                user=auth_user,
-                **tag,
-            )
+    def _get_or_create_tags(self, tags, recipe):
+        """Handle getting or create tags as needed"""
 
-            recipe.tags.add(tag_obj)
+        if tags:
+            recipe.tags.add(*self._get_or_create_attrs(Tag, tags))
 
     def _get_or_create_ingredients(self, ingredients, recipe):
         """Handle getting or create ingredients as needed"""
 
-        auth_user = self.context["request"].user
-
-        for ingredient in ingredients:
-            ingredient_obj, created = Ingredient.objects.get_or_create(  # noqa
-                user=auth_user,
-                **ingredient,
+        if ingredients:
+            recipe.ingredients.add(
+                *self._get_or_create_attrs(Ingredient, ingredients),
             )
 
-            recipe.ingredients.add(ingredient_obj)
-
     def create(self, validated_data):
         """Create recipe"""
 
@@ -14,15 +14,17 @@ from core.models import (
     Ingredient,
     Recipe,
 )
-from recipe.serializers import IngredientSerializer
 
 
 INGREDIENTS_URL = reverse("recipe:ingredient-list")
+INGREDIENT_DETAIL_URL = "{}".join(
+    reverse("recipe:ingredient-detail", args=[0]).rsplit("0", 1)
+)
 
 
 def detail_url(ingredient_id):
     """Create and return ingredient detail url"""
-    return reverse("recipe:ingredient-detail", args=[ingredient_id])
+    return INGREDIENT_DETAIL_URL.format(ingredient_id)
 
 
 def create_user(email="user@example.com", password="test123_"):
@@ -47,31 +49,35 @@ class PublicIngredientAPITests(TestCase):
 class PrivateIngredientsAPITests(TestCase):
     """Test authenticated API requests"""
 
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
-        self.user = create_user()
-        self.client = APIClient()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_ingredient_list(self):
         """Test retrieving ingredient list"""
 
-        Ingredient.objects.create(
-            user=self.user,
-            name="Chocolate",
-        )
-
-        Ingredient.objects.create(
-            user=self.user,
-            name="Vanilla",
+        chocolate, vanilla = Ingredient.objects.bulk_create(
+            [
+                Ingredient(user=self.user, name="Chocolate"),
+                Ingredient(user=self.user, name="Vanilla"),
+            ]
         )
 
-        response = self.client.get(INGREDIENTS_URL)
+        with self.assertNumQueries(1):
+            response = self.client.get(INGREDIENTS_URL)
 
-        ingredients = Ingredient.objects.all().order_by("-name")
-        serializer = IngredientSerializer(ingredients, many=True)
+        expected = [
+            {"id": vanilla.id, "name": "Vanilla"},
+            {"id": chocolate.id, "name": "Chocolate"},
+        ]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data, expected)
 
     def test_ingredient_limited_to_auth_user(self):
         """Test list of ingredient returned is limited to authenticated user"""
@@ -119,8 +125,12 @@ class PrivateIngredientsAPITests(TestCase):
     def test_filter_ingredients_assigned_to_recipe(self):
         """Test listing ingredients by those assigned to recipes"""
 
-        in1 = Ingredient.objects.create(user=self.user, name="Apple")
-        in2 = Ingredient.objects.create(user=self.user, name="Banana")
+        in1, in2 = Ingredient.objects.bulk_create(
+            [
+                Ingredient(user=self.user, name="Apple"),
+                Ingredient(user=self.user, name="Banana"),
+            ]
+        )
 
         recipe = Recipe.objects.create(
             title="Apple cream",
@@ -129,38 +139,53 @@ class PrivateIngredientsAPITests(TestCase):
             user=self.user,
         )
 
-        recipe.ingredients.add(in1)
+        Recipe.ingredients.through.objects.create(
+            recipe=recipe,
+            ingredient=in1,
+        )
 
         response = self.client.get(INGREDIENTS_URL, {"assigned_only": 1})
 
-        s1 = IngredientSerializer(in1)
-        s2 = IngredientSerializer(in2)
+        expected1 = {"id": in1.id, "name": in1.name}
+        expected2 = {"id": in2.id, "name": in2.name}
 
-        self.assertIn(s1.data, response.data)
-        self.assertNotIn(s2.data, response.data)
+        self.assertIn(expected1, response.data)
+        self.assertNotIn(expected2, response.data)
 
     def test_filtered_ingredients_unique(self):
         """Test filter ingredients return unique list"""
 
-        ing = Ingredient.objects.create(user=self.user, name="Eggs")
-        Ingredient.objects.create(user=self.user, name="Menthe")
-
-        recipe1 = Recipe.objects.create(
-            title="Soft eggs",
-            time_minutes=9,
-            price=Decimal("91.1"),
-            user=self.user,
+        ing, _ = Ingredient.objects.bulk_create(
+            [
+                Ingredient(user=self.user, name="Eggs"),
+                Ingredient(user=self.user, name="Menthe"),
+            ]
         )
 
-        recipe2 = Recipe.objects.create(
-            title="Not soft eggs",
-            time_minutes=19,
-            price=Decimal("41.1"),
-            user=self.user,
+        recipes = Recipe.objects.bulk_create(
+            [
+                Recipe(
+                    title="Soft eggs",
+                    time_minutes=9,
+                    price=Decimal("91.1"),
+                    user=self.user,
+                ),
+                Recipe(
+                    title="Not soft eggs",
+                    time_minutes=19,
+                    price=Decimal("41.1"),
+                    user=self.user,
+                ),
+            ]
         )
 
-        recipe1.ingredients.add(ing)
-        recipe2.ingredients.add(ing)
+        RecipeIngredient = Recipe.ingredients.through
+        RecipeIngredient.objects.bulk_create(
+            [
+                RecipeIngredient(recipe=recipe, ingredient=ing)
+                for recipe in recipes
+            ]
+        )
 
         response = self.client.get(INGREDIENTS_URL, {"assigned_only": 1})
 
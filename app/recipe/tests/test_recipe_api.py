@@ -4,16 +4,22 @@ Test for recipe APIs
 """
 
 from decimal import Decimal
+from io import BytesIO
 import os
-import tempfile
 
 from PIL import Image
 
 from django.contrib.auth import get_user_model
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
 from django.test import TestCase
 from django.urls import reverse
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.test import (
+    APIClient,
+    APIRequestFactory,
+    force_authenticate,
+)
 
 from core.models import (
     Recipe,
@@ -24,23 +30,46 @@ from recipe.serializers import (
     RecipeSerializer,
     RecipeDetailSerializer,
 )
+from recipe.views import (
+    MAX_IDS,
+    MAX_ID_ENTRIES,
+    RecipeDetailView,
+)
 
 
 RECIPE_URL = reverse("recipe:recipe-list")
+RECIPE_DETAIL_URL = "{}".join(
+    reverse("recipe:recipe-detail", args=[0]).rsplit("0", 1)
+)
+RECIPE_IMAGE_UPLOAD_URL = "{}".join(
+    reverse("recipe:recipe-upload-image", args=[0]).rsplit("0", 1)
+)
 
 
 def detail_url(recipe_id):
     """Create and return recipe detail ULR"""
-    return reverse("recipe:recipe-detail", args=[recipe_id])
+    return RECIPE_DETAIL_URL.format(recipe_id)
+
+
+def create_jpeg_bytes():
+    """Create and return the content of a 10x10 JPEG image"""
+
+    buffer = BytesIO()
+    Image.new("RGB", (10, 10)).save(buffer, format="JPEG")
+
+    return buffer.getvalue()
+
+
+TINY_JPEG_BYTES = create_jpeg_bytes()
 
 
 def image_upload_url(recipe_id):
     """Create and return an image upload url"""
-    return reverse("recipe:recipe-upload-image", args=[recipe_id])
+    return RECIPE_IMAGE_UPLOAD_URL.format(recipe_id)
 
 
-def create_recipe(user, **params):
-    """Create and return recipe"""
+def build_recipe(user, **params):
+    """Build and return an unsaved recipe"""
 
     defaults = {
         "title": "Sample recipe test",
@@ -52,11 +81,80 @@ def create_recipe(user, **params):
 
     defaults.update(params)
 
-    recipe = Recipe.objects.create(user=user, **defaults)
+    return Recipe(user=user, **defaults)
+
+
+def create_recipe(user, **params):
+    """Create and return recipe"""
+
+    recipe = build_recipe(user, **params)
+    recipe.save()
 
     return recipe
 
 
+def create_recipes(user, n=2, **params):
+    """Create and return n recipes with a single INSERT"""
+
+    return Recipe.objects.bulk_create(
+        [build_recipe(user, **params) for _ in range(n)]
+    )
+
+
+def recipe_to_dict(recipe):
+    """Return the expected list representation of a recipe"""
+
+    return {
+        "id": recipe.id,
+        "title": recipe.title,
+        "time_minutes": recipe.time_minutes,
+        "price": f"{recipe.price:.2f}",
+        "link": recipe.link,
+        "tags": [],
+        "ingredients": [],
+    }
+
+
+RELATION_MODELS = {"tags": Tag, "ingredients": Ingredient}
+
+UPDATE_RELATION_CASES = [
+    # Create a new object on update
+    {"relation": "tags", "assigned": [], "existing": [], "payload": ["super"]},
+    {
+        "relation": "ingredients",
+        "assigned": [],
+        "existing": [],
+        "payload": ["Lemon"],
+    },
+    # Swap the assigned object for an existing one
+    {
+        "relation": "tags",
+        "assigned": ["breakfast"],
+        "existing": ["lunch"],
+        "payload": ["lunch"],
+    },
+    {
+        "relation": "ingredients",
+        "assigned": ["Pepper"],
+        "existing": ["Chili"],
+        "payload": ["Chili"],
+    },
+    # Clear every assigned object
+    {
+        "relation": "tags",
+        "assigned": ["Bio Food"],
+        "existing": [],
+        "payload": [],
+    },
+    {
+        "relation": "ingredients",
+        "assigned": ["garlic"],
+        "existing": [],
+        "payload": [],
+    },
+]
+
+
 def create_user(**params):
     """Create and return user"""
     return get_user_model().objects.create_user(**params)
@@ -81,27 +179,56 @@ class PublicRecipeAPITests(TestCase):
 class PrivateRecipeAPITests(TestCase):
     """Test authenticated API call"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="test@example.com",
             password="testpassword",
         )
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
 
     def test_retrieve_recipes(self):
         """Test retrieving list of recipes"""
 
-        create_recipe(user=self.user)
-        create_recipe(user=self.user)
+        r1, r2 = create_recipes(user=self.user)
+        expected = [recipe_to_dict(r2), recipe_to_dict(r1)]
 
-        response = self.client.get(RECIPE_URL)
+        for method in ["get", "head"]:
+            with self.subTest(method=method):
+                with self.assertNumQueries(3):
+                    response = getattr(self.client, method)(RECIPE_URL)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(response.data, expected)
+
+    def test_retrieve_recipes_with_relations(self):
+        """Test listing recipes with tags and ingredients stays eager"""
+
+        recipes = create_recipes(user=self.user)
+        tag = Tag.objects.create(user=self.user, name="Dinner")
+        ingredient = Ingredient.objects.create(user=self.user, name="Rice")
+        for recipe in recipes:
+            recipe.tags.add(tag)
+            recipe.ingredients.add(ingredient)
 
-        recipes = Recipe.objects.all().order_by("-id")
-        serializer = RecipeSerializer(recipes, many=True)
+        with self.assertNumQueries(3):
+            response = self.client.get(RECIPE_URL)
+
+        recipes = (
+            Recipe.objects.filter(user=self.user)
+            .prefetch_related("tags", "ingredients")
+            .order_by("-id")
+        )
+        with self.assertNumQueries(3):
+            serializer = RecipeSerializer(recipes, many=True)
+            expected = serializer.data
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data, expected)
 
     def test_recipe_limited_to_user(self):
         """Test recipe is limited to authenticated user"""
@@ -111,24 +238,54 @@ class PrivateRecipeAPITests(TestCase):
             password="testpassword",
         )
 
-        create_recipe(user=other_user)
-        create_recipe(user=self.user)
+        _, recipe = Recipe.objects.bulk_create(
+            [build_recipe(user=other_user), build_recipe(user=self.user)]
+        )
 
         respone = self.client.get(RECIPE_URL)
 
-        recipes = Recipe.objects.filter(user=self.user)
+        self.assertEqual(respone.status_code, status.HTTP_200_OK)
+        self.assertEqual(respone.data, [recipe_to_dict(recipe)])
 
-        serializer = RecipeSerializer(recipes, many=True)
+    def test_api_root_lists_recipes(self):
+        """Test recipes are discoverable from the API root"""
 
-        self.assertEqual(respone.status_code, status.HTTP_200_OK)
-        self.assertEqual(respone.data, serializer.data)
+        response = self.client.get(reverse("recipe:api-root"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            list(response.data),
+            ["recipes", "tags", "ingredients"],
+        )
+
+    def test_recipe_format_suffix(self):
+        """Test recipe routes accept a format suffix"""
+
+        recipe = create_recipe(user=self.user)
+        urls = [
+            reverse("recipe:recipe-list", kwargs={"format": "json"}),
+            reverse(
+                "recipe:recipe-detail",
+                kwargs={"pk": recipe.id, "format": "json"},
+            ),
+        ]
+
+        for url in urls:
+            with self.subTest(url=url):
+                response = self.client.get(url)
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
 
     def test_get_recipe_detail(self):
         """Test get recipe detail"""
 
         recipe = create_recipe(user=self.user)
         url = detail_url(recipe_id=recipe.id)
-        respone = self.client.get(url)
+
+        request = APIRequestFactory().get(url)
+        force_authenticate(request, user=self.user)
+        view = RecipeDetailView.as_view()
+        respone = view(request, pk=recipe.id)
 
         serializer = RecipeDetailSerializer(recipe)
 
@@ -146,12 +303,18 @@ class PrivateRecipeAPITests(TestCase):
         response = self.client.post(RECIPE_URL, payload)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
-        recipe = Recipe.objects.get(id=response.data["id"])
+        recipe = Recipe.objects.only(
+            "id",
+            "title",
+            "time_minutes",
+            "price",
+            "user_id",
+        ).get(pk=response.data["id"])
 
         for k, v in payload.items():
             self.assertEqual(getattr(recipe, k), v)
 
-        self.assertEqual(recipe.user, self.user)
+        self.assertEqual(recipe.user_id, self.user.id)
 
     def test_partial_update(self):
         """Test partial update of a recipe"""
@@ -173,7 +336,7 @@ class PrivateRecipeAPITests(TestCase):
         recipe.refresh_from_db()
         self.assertEqual(recipe.title, payload["title"])
         self.assertEqual(recipe.link, original_link)
-        self.assertEqual(recipe.user, self.user)
+        self.assertEqual(recipe.user_id, self.user.id)
 
     def test_full_update(self):
         """Full update of a recipe"""
@@ -204,7 +367,7 @@ class PrivateRecipeAPITests(TestCase):
         for k, v in payload.items():
             self.assertEqual(getattr(recipe, k), v)
 
-        self.assertEqual(recipe.user, self.user)
+        self.assertEqual(recipe.user_id, self.user.id)
 
     def test_update_user_return_error(self):
         """Test changing recipe user return error"""
@@ -223,7 +386,7 @@ class PrivateRecipeAPITests(TestCase):
 
         recipe.refresh_from_db()
 
-        self.assertEqual(recipe.user, self.user)
+        self.assertEqual(recipe.user_id, self.user.id)
 
     def test_delete_recipe(self):
         """Test delete recipe success"""
@@ -262,7 +425,8 @@ class PrivateRecipeAPITests(TestCase):
             "tags": [{"name": "Tag1"}, {"name": "Tag2"}],
         }
 
-        response = self.client.post(RECIPE_URL, payload, format="json")
+        with self.assertNumQueries(6):
+            response = self.client.post(RECIPE_URL, payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         recipes = Recipe.objects.filter(user=self.user)
 
@@ -270,13 +434,11 @@ class PrivateRecipeAPITests(TestCase):
         recipe = recipes[0]
 
         self.assertEqual(recipe.tags.count(), 2)
+        tag_names = set(
+            Tag.objects.filter(user=self.user).values_list("name", flat=True)
+        )
         for tag in payload["tags"]:
-            exists = Tag.objects.filter(
-                user=self.user,
-                name=tag["name"],
-            ).exists()
-
-            self.assertTrue(exists)
+            self.assertIn(tag["name"], tag_names)
 
     def test_create_recipe_with_existing_tags(self):
         """Test creating new recipe with existing tags"""
@@ -305,61 +467,11 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(recipe.tags.count(), 2)
         self.assertIn(tag_indian, recipe.tags.all())
 
+        tag_names = set(
+            recipe.tags.filter(user=self.user).values_list("name", flat=True)
+        )
         for tag in payload["tags"]:
-            exists = recipe.tags.filter(
-                user=self.user,
-                name=tag["name"],
-            ).exists()
-
-            self.assertTrue(exists)
-
-    def test_create_tag_on_update(self):
-        """Create new tag on update"""
-
-        recipe = create_recipe(user=self.user)
-
-        payload = {"tags": [{"name": "super"}]}
-
-        url = detail_url(recipe_id=recipe.id)
-        response = self.client.patch(url, payload, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-
-        new_tag = Tag.objects.get(user=self.user, name="super")
-        self.assertIn(new_tag, recipe.tags.all())
-
-    def test_update_recipe_assign_tag(self):
-        """Test assigning an existsing tag when updating a recipe"""
-
-        tag_breakfast = Tag.objects.create(user=self.user, name="breakfast")
-        recipe = create_recipe(user=self.user)
-        recipe.tags.add(tag_breakfast)
-
-        tag_lunch = Tag.objects.create(user=self.user, name="lunch")
-        payload = {"tags": [{"name": "lunch"}]}
-
-        url = detail_url(recipe_id=recipe.id)
-
-        response = self.client.patch(url, payload, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(tag_lunch, recipe.tags.all())
-        self.assertNotIn(tag_breakfast, recipe.tags.all())
-
-    def test_clear_recipe_tags(self):
-        """Test clearing tags assigned to recipe"""
-
-        tag = Tag.objects.create(user=self.user, name="Bio Food")
-        recipe = create_recipe(user=self.user)
-
-        recipe.tags.add(tag)
-
-        payload = {"tags": []}
-        url = detail_url(recipe_id=recipe.id)
-
-        response = self.client.patch(url, payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertNotIn(tag, recipe.tags.all())
+            self.assertIn(tag["name"], tag_names)
 
     # Test for ingredients
     def test_new_recipe_with_ingredients(self):
@@ -379,13 +491,14 @@ class PrivateRecipeAPITests(TestCase):
         recipe = recipes[0]
 
         self.assertEqual(recipe.ingredients.count(), 2)
+        ingredient_names = set(
+            recipe.ingredients.filter(user=self.user).values_list(
+                "name",
+                flat=True,
+            )
+        )
         for ingredient in payload["ingredients"]:
-            exists = recipe.ingredients.filter(
-                name=ingredient["name"],
-                user=self.user,
-            ).exists()
-
-            self.assertTrue(exists)
+            self.assertIn(ingredient["name"], ingredient_names)
 
     def test_recipe_with_existing_ingredient(self):
         """Test creating recipe with existsing ingredient"""
@@ -413,105 +526,199 @@ class PrivateRecipeAPITests(TestCase):
         self.assertEqual(recipe.ingredients.count(), 2)
         self.assertIn(ingredients, recipe.ingredients.all())
 
+        ingredient_names = set(
+            recipe.ingredients.filter(user=self.user).values_list(
+                "name",
+                flat=True,
+            )
+        )
         for ingredient in payload["ingredients"]:
-            exists = recipe.ingredients.filter(
-                user=self.user,
-                name=ingredient["name"],
-            ).exists()
+            self.assertIn(ingredient["name"], ingredient_names)
+
+    # Test for updating tags and ingredients
+    def test_update_recipe_relations(self):
+        """Test updating the tags and ingredients assigned to a recipe"""
+
+        for i, case in enumerate(UPDATE_RELATION_CASES):
+            with self.subTest(**case):
+                relation = case["relation"]
+                model = RELATION_MODELS[relation]
+
+                # A user per case keeps earlier cases out of the counts
+                user = create_user(
+                    email=f"case{i}@example.com",
+                    password="testpassword",
+                )
+                self.client.force_authenticate(user)
+
+                recipe = create_recipe(user=user)
+                objs = model.objects.bulk_create(
+                    [
+                        model(user=user, name=name)
+                        for name in case["assigned"] + case["existing"]
+                    ]
+                )
+                getattr(recipe, relation).add(*objs[: len(case["assigned"])])
+
+                payload = {relation: [{"name": n} for n in case["payload"]]}
+                url = detail_url(recipe_id=recipe.id)
+
+                response = self.client.patch(url, payload, format="json")
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                names = getattr(recipe, relation).values_list(
+                    "name",
+                    flat=True,
+                )
+                self.assertEqual(set(names), set(case["payload"]))
+
+                # Existing objects are reused instead of duplicated
+                matching = model.objects.filter(
+                    user=user,
+                    name__in=case["payload"],
+                )
+                self.assertEqual(matching.count(), len(case["payload"]))
 
-            self.assertTrue(exists)
+    def test_filter_by_tags(self):
+        """Test filtering recipes by tags"""
 
-    def test_create_ingredient_on_update(self):
-        """Test creating ingredient on updating a recipe"""
+        r1, r2, r3 = Recipe.objects.bulk_create(
+            [
+                build_recipe(user=self.user, title="Sample title 1"),
+                build_recipe(user=self.user, title="Sample title 2"),
+                build_recipe(user=self.user, title="Sample title 3"),
+            ]
+        )
+        tag1, tag2 = Tag.objects.bulk_create(
+            [
+                Tag(user=self.user, name="Vegan"),
+                Tag(user=self.user, name="Vegetarian"),
+            ]
+        )
+        RecipeTag = Recipe.tags.through
+        RecipeTag.objects.bulk_create(
+            [
+                RecipeTag(recipe=r1, tag=tag1),
+                RecipeTag(recipe=r2, tag=tag2),
+            ]
+        )
 
-        recipe = create_recipe(user=self.user)
-        payload = {"ingredients": [{"name": "Lemon"}]}
-        url = detail_url(recipe_id=recipe.id)
+        params = {"tags": f"{tag1.id}, {tag2.id}"}
+        response = self.client.get(RECIPE_URL, params)
 
-        response = self.client.patch(url, payload, format="json")
+        s1 = RecipeSerializer(r1)
+        s2 = RecipeSerializer(r2)
+        s3 = RecipeSerializer(r3)
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn(s1.data, response.data)
+        self.assertIn(s2.data, response.data)
+        self.assertNotIn(s3.data, response.data)
 
-        new_ingredient = Ingredient.objects.get(
-            user=self.user,
-            name="Lemon",
+    def test_filter_by_tags_unique(self):
+        """Test recipe matching several tags is listed once"""
+
+        recipe = create_recipe(user=self.user)
+        tag1, tag2 = Tag.objects.bulk_create(
+            [
+                Tag(user=self.user, name="Spicy"),
+                Tag(user=self.user, name="Quick"),
+            ]
         )
-        self.assertIn(new_ingredient, recipe.ingredients.all())
+        recipe.tags.add(tag1, tag2)
 
-    def test_update_recipe_assign_ingredient(self):
-        """Test assigning an existing ingredient when updating recipe"""
+        params = {"tags": f"{tag1.id},{tag2.id}"}
+        response = self.client.get(RECIPE_URL, params)
 
-        ingredient1 = Ingredient.objects.create(
-            user=self.user,
-            name="Pepper",
-        )
-        recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient1)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["id"], recipe.id)
 
-        ingredient2 = Ingredient.objects.create(
-            user=self.user,
-            name="Chili",
-        )
-        payload = {"ingredients": [{"name": "Chili"}]}
+    def test_filter_by_repeated_ids(self):
+        """Test filtering with a long list of repeated IDs"""
 
-        url = detail_url(recipe_id=recipe.id)
-        response = self.client.patch(url, payload, format="json")
+        recipe = create_recipe(user=self.user)
+        tag = Tag.objects.create(user=self.user, name="Breakfast")
+        recipe.tags.add(tag)
+
+        params = {"tags": ",".join([str(tag.id)] * 1000)}
+        response = self.client.get(RECIPE_URL, params)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertIn(ingredient2, recipe.ingredients.all())
-        self.assertNotIn(ingredient1, recipe.ingredients.all())
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["id"], recipe.id)
 
-    def test_clear_recipe_ingredient(self):
-        """Test to clear a recipes ingredients"""
+    def test_filter_by_id_past_repeats(self):
+        """Test distinct ID after many repeats still filters"""
 
-        ingredient = Ingredient.objects.create(
-            user=self.user,
-            name="garlic",
-        )
         recipe = create_recipe(user=self.user)
-        recipe.ingredients.add(ingredient)
+        tag, other = Tag.objects.bulk_create(
+            [
+                Tag(user=self.user, name="Lunch"),
+                Tag(user=self.user, name="Dinner"),
+            ]
+        )
+        recipe.tags.add(tag)
 
-        payload = {"ingredients": []}
-        url = detail_url(recipe_id=recipe.id)
+        params = {"tags": ",".join([str(other.id)] * MAX_IDS + [str(tag.id)])}
+        response = self.client.get(RECIPE_URL, params)
 
-        response = self.client.patch(url, payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(recipe.ingredients.count(), 0)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["id"], recipe.id)
 
-    def test_filter_by_tags(self):
-        """Test filtering recipes by tags"""
+    def test_filter_by_too_many_ids(self):
+        """Test filtering with too many IDs returns error"""
 
-        r1 = create_recipe(user=self.user, title="Sample title 1")
-        r2 = create_recipe(user=self.user, title="Sample title 2")
-        tag1 = Tag.objects.create(user=self.user, name="Vegan")
-        tag2 = Tag.objects.create(user=self.user, name="Vegetarian")
-        r1.tags.add(tag1)
-        r2.tags.add(tag2)
+        values = [
+            ",".join(map(str, range(1, MAX_IDS + 2))),
+            ",".join(["1"] * (MAX_ID_ENTRIES + 1)),
+        ]
 
-        r3 = create_recipe(user=self.user, title="Sample title 3")
+        for value in values:
+            with self.subTest(entries=value.count(",") + 1):
+                response = self.client.get(RECIPE_URL, {"tags": value})
 
-        params = {"tags": f"{tag1.id}, {tag2.id}"}
-        response = self.client.get(RECIPE_URL, params)
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST,
+                )
 
-        s1 = RecipeSerializer(r1)
-        s2 = RecipeSerializer(r2)
-        s3 = RecipeSerializer(r3)
+    def test_filter_by_malformed_ids(self):
+        """Test filtering with malformed IDs returns error"""
 
-        self.assertIn(s1.data, response.data)
-        self.assertIn(s2.data, response.data)
-        self.assertNotIn(s3.data, response.data)
+        values = ["1,abc", "1,,2", ",", "9" * 19, "1," + "9" * 5000]
+
+        for value in values:
+            with self.subTest(value=value):
+                response = self.client.get(RECIPE_URL, {"tags": value})
+
+                self.assertEqual(
+                    response.status_code,
+                    status.HTTP_400_BAD_REQUEST,
+                )
 
     def test_filter_by_ingredients(self):
         """Test filtering recipes by ingredients"""
 
-        r1 = create_recipe(user=self.user, title="Other sample title 1")
-        r2 = create_recipe(user=self.user, title="Other sample title 2")
-        in1 = Ingredient.objects.create(user=self.user, name="Sugar")
-        in2 = Ingredient.objects.create(user=self.user, name="Salt")
-        r1.ingredients.add(in1)
-        r2.ingredients.add(in2)
-
-        r3 = create_recipe(user=self.user, title="Other sample title 3")
+        r1, r2, r3 = Recipe.objects.bulk_create(
+            [
+                build_recipe(user=self.user, title="Other sample title 1"),
+                build_recipe(user=self.user, title="Other sample title 2"),
+                build_recipe(user=self.user, title="Other sample title 3"),
+            ]
+        )
+        in1, in2 = Ingredient.objects.bulk_create(
+            [
+                Ingredient(user=self.user, name="Sugar"),
+                Ingredient(user=self.user, name="Salt"),
+            ]
+        )
+        RecipeIngredient = Recipe.ingredients.through
+        RecipeIngredient.objects.bulk_create(
+            [
+                RecipeIngredient(recipe=r1, ingredient=in1),
+                RecipeIngredient(recipe=r2, ingredient=in2),
+            ]
+        )
 
         params = {"ingredients": f"{in1.id}, {in2.id}"}
         response = self.client.get(RECIPE_URL, params)
@@ -528,28 +735,34 @@ class PrivateRecipeAPITests(TestCase):
 class ImageUploadTest(TestCase):
     """Tests for the image upload API"""
 
-    def setUp(self):
-        self.client = APIClient()
-        self.user = get_user_model().objects.create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = get_user_model().objects.create_user(
             "user@example.com",
             "testpass123_",
         )
+        cls.recipe = create_recipe(user=cls.user)
+
+    def setUp(self):
         self.client.force_authenticate(self.user)
-        self.recipe = create_recipe(user=self.user)
 
     def tearDown(self):
-        self.recipe.image.delete()
+        if self.recipe.image:
+            default_storage.delete(self.recipe.image.name)
 
     def test_upload_image(self):
         """Test uploading an image to a recipe"""
         url = image_upload_url(self.recipe.id)
 
-        with tempfile.NamedTemporaryFile(suffix=".jpeg") as img_file:
-            img = Image.new("RGB", (10, 10))
-            img.save(img_file, format="JPEG")
-            img_file.seek(0)
-            payload = {"image": img_file}
-            response = self.client.post(url, payload, format="multipart")
+        image = SimpleUploadedFile(
+            "image.jpeg",
+            TINY_JPEG_BYTES,
+            content_type="image/jpeg",
+        )
+        payload = {"image": image}
+        response = self.client.post(url, payload, format="multipart")
 
         self.recipe.refresh_from_db()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
@@ -565,3 +778,15 @@ class ImageUploadTest(TestCase):
         response = self.client.post(url, payload, format="multipart")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_upload_image_requires_multipart(self):
+        """Test image upload rejects non multipart payloads"""
+
+        url = image_upload_url(self.recipe.id)
+
+        response = self.client.post(url, {"image": ""}, format="json")
+
+        self.assertEqual(
+            response.status_code,
+            status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+        )
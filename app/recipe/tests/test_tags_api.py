@@ -10,14 +10,16 @@ from rest_framework.test import APIClient
 
 
 from core.models import Tag, Recipe
-from recipe.serializers import TagSerializer
 
 TAG_URL = reverse("recipe:tag-list")
+TAG_DETAIL_URL = "{}".join(
+    reverse("recipe:tag-detail", args=[0]).rsplit("0", 1)
+)
 
 
 def detail_url(tag_id):
     """Create and return a tag detail"""
-    return reverse("recipe:tag-detail", args=[tag_id])
+    return TAG_DETAIL_URL.format(tag_id)
 
 
 def create_user(email="test@example.com", password="testpass1234_"):
@@ -44,24 +46,31 @@ class PublicTagsAPITests(TestCase):
 class PrivateTagsAPITests(TestCase):
     """Test for authenticated user to make an API request"""
 
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user()
+
     def setUp(self):
-        self.client = APIClient()
-        self.user = create_user()
         self.client.force_authenticate(self.user)
 
     def test_retrieve_tags(self):
         """Test retrieve list of tags"""
 
-        Tag.objects.create(user=self.user, name="Tag1")
-        Tag.objects.create(user=self.user, name="Tag2")
+        tag1 = Tag.objects.create(user=self.user, name="Tag1")
+        tag2 = Tag.objects.create(user=self.user, name="Tag2")
 
-        response = self.client.get(TAG_URL)
-        tags = Tag.objects.all().order_by("-name")
+        with self.assertNumQueries(1):
+            response = self.client.get(TAG_URL)
 
-        serializer = TagSerializer(tags, many=True)
+        expected = [
+            {"id": tag2.id, "name": "Tag2"},
+            {"id": tag1.id, "name": "Tag1"},
+        ]
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, serializer.data)
+        self.assertEqual(response.data, expected)
 
     def test_tags_limited_to_user(self):
         """Test list of tags is limited to authenticated user only"""
@@ -118,11 +127,11 @@ class PrivateTagsAPITests(TestCase):
         recipe.tags.add(tag1)
 
         response = self.client.get(TAG_URL, {"assigned_only": 1})
-        s1 = TagSerializer(tag1)
-        s2 = TagSerializer(tag2)
+        expected1 = {"id": tag1.id, "name": tag1.name}
+        expected2 = {"id": tag2.id, "name": tag2.name}
 
-        self.assertIn(s1.data, response.data)
-        self.assertNotIn(s2.data, response.data)
+        self.assertIn(expected1, response.data)
+        self.assertNotIn(expected2, response.data)
 
     def test_filtered_tags_unique(self):
         """Test filter tags return unique list"""
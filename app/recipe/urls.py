@@ -1,15 +1,30 @@
 """urls mapping for the recipe APIs"""
 
-from django.urls import (
-    path,
-    include,
-)
+from django.urls import path
 
 from rest_framework.routers import DefaultRouter
+from rest_framework.urlpatterns import format_suffix_patterns
 from recipe import views
 
-router = DefaultRouter()
-router.register("recipes", views.RecipeViewSets)
+
+class RecipeRouter(DefaultRouter):
+    """Default router whose API root also lists the recipe views"""
+
+    # Suffixes are added once for all patterns in urlpatterns below
+    include_format_suffixes = False
+
+    def get_api_root_view(self, api_urls=None):
+        """Return the API root view, recipes first"""
+
+        api_root_dict = {"recipes": "recipe-list"}
+        list_name = self.routes[0].name
+        for prefix, viewset, basename in self.registry:
+            api_root_dict[prefix] = list_name.format(basename=basename)
+
+        return self.APIRootView.as_view(api_root_dict=api_root_dict)
+
+
+router = RecipeRouter()
 router.register("tags", views.TagViewSet)
 router.register("ingredients", views.IngredientViewSet)
 
@@ -17,5 +32,22 @@ app_name = "recipe"
 
 
 urlpatterns = [
-    path("", include(router.urls)),
+    path(
+        "recipes/",
+        views.RecipeListCreateView.as_view(),
+        name="recipe-list",
+    ),
+    path(
+        "recipes/<int:pk>/",
+        views.RecipeDetailView.as_view(),
+        name="recipe-detail",
+    ),
+    path(
+        "recipes/<int:pk>/upload-image/",
+        views.RecipeImageUploadView.as_view(),
+        name="recipe-upload-image",
+    ),
+    *router.urls,
 ]
+
+urlpatterns = format_suffix_patterns(urlpatterns)
@@ -1,5 +1,8 @@
 """Views for recipe API"""
 
+import re
+
+from django.db.models import Exists, OuterRef
 from drf_spectacular.utils import (
     extend_schema_view,
     extend_schema,
@@ -7,15 +10,17 @@ from drf_spectacular.utils import (
     OpenApiTypes,
 )
 from rest_framework import (
+    generics,
     viewsets,
     mixins,
     status,
 )
-from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
-from rest_framework.authentication import TokenAuthentication
 from rest_framework import permissions
 
+from core.authentication import CachedTokenAuthentication
 from core.models import (
     Recipe,
     Tag,
@@ -24,8 +29,30 @@ from core.models import (
 from recipe import serializers
 
 
+# At most 18 digits per ID so every value fits a 64-bit integer column
+IDS_PATTERN = re.compile(r"\s*\d{1,18}\s*(,\s*\d{1,18}\s*)*")
+MAX_IDS = 100
+# Repeats are allowed, but the raw list is bounded before parsing it
+MAX_ID_ENTRIES = 10 * MAX_IDS
+
+
+class RecipeViewMixin:
+    """Common setup for views managing the user's recipes"""
+
+    queryset = Recipe.objects.all()
+    authentication_classes = [CachedTokenAuthentication]
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get_queryset(self):
+        """Filter recipes for authenticated user only"""
+
+        return self.queryset.filter(
+            user=self.request.user,
+        ).order_by("-id")
+
+
 @extend_schema_view(
-    list=extend_schema(
+    get=extend_schema(
         parameters=[
             OpenApiParameter(
                 "tags",
@@ -40,59 +67,108 @@ from recipe import serializers
         ]
     )
 )
-class RecipeViewSets(viewsets.ModelViewSet):
-    """View to manage recipe APIs"""
+class RecipeListCreateView(RecipeViewMixin, generics.ListCreateAPIView):
+    """List and create recipes"""
 
-    queryset = Recipe.objects.all()
     serializer_class = serializers.RecipeDetailSerializer
-    authentication_classes = [TokenAuthentication]
-    permission_classes = [permissions.IsAuthenticated]
+    method_serializers = {
+        "GET": serializers.RecipeSerializer,
+        "HEAD": serializers.RecipeSerializer,
+    }
 
     def _params_to_ints(self, qs):
-        """Convert a list of strings to integers"""
+        """Convert a list of strings to at most MAX_IDS unique integers"""
+
+        if qs.count(",") >= MAX_ID_ENTRIES:
+            raise ValidationError(f"Expected at most {MAX_ID_ENTRIES} IDs")
 
-        return [int(str_id) for str_id in qs.split(",")]
+        if not IDS_PATTERN.fullmatch(qs):
+            raise ValidationError("Expected a comma separated list of IDs")
+
+        ids = {int(x) for x in qs.split(",")}
+        if len(ids) > MAX_IDS:
+            raise ValidationError(f"Expected at most {MAX_IDS} distinct IDs")
+
+        return list(ids)
 
     def get_queryset(self):
-        """Filter recipes for authenticated user only"""
+        """Filter listed recipes by tags and ingredients"""
 
         tags = self.request.query_params.get("tags")
         ingredients = self.request.query_params.get("ingredients")
-        queryset = self.queryset
+        queryset = (
+            super()
+            .get_queryset()
+            .prefetch_related("tags", "ingredients")
+            .only(
+                "id",
+                "title",
+                "time_minutes",
+                "price",
+                "link",
+            )
+        )
 
         if tags:
             tag_ids = self._params_to_ints(tags)
-            queryset = queryset.filter(tags__id__in=tag_ids)
+            queryset = queryset.filter(
+                Exists(
+                    Recipe.tags.through.objects.filter(
+                        recipe_id=OuterRef("pk"),
+                        tag_id__in=tag_ids,
+                    )
+                )
+            )
 
         if ingredients:
             ingredients_id = self._params_to_ints(ingredients)
-            queryset = queryset.filter(ingredients__id__in=ingredients_id)
-
-        return (
-            queryset.filter(
-                user=self.request.user,
+            queryset = queryset.filter(
+                Exists(
+                    Recipe.ingredients.through.objects.filter(
+                        recipe_id=OuterRef("pk"),
+                        ingredient_id__in=ingredients_id,
+                    )
+                )
             )
-            .order_by("-id")
-            .distinct()
-        )
+
+        return queryset
 
     def get_serializer_class(self):
         """Return serializer class for request"""
 
-        if self.action == "list":
-            return serializers.RecipeSerializer
-        elif self.action == "upload_image":
-            return serializers.RecipeImageSerializer
-
-        return self.serializer_class
+        return self.method_serializers.get(
+            self.request.method,
+            self.serializer_class,
+        )
 
     def perform_create(self, serializer):
         """Create new recipe for authenticated user"""
 
         serializer.save(user=self.request.user)
 
-    @action(methods=["POST"], detail=True, url_path="upload-image")
-    def upload_image(self, request, pk=None):
+
+class RecipeDetailView(RecipeViewMixin, generics.RetrieveUpdateDestroyAPIView):
+    """Retrieve, update and delete a recipe"""
+
+    serializer_class = serializers.RecipeDetailSerializer
+
+    def get_queryset(self):
+        """Prefetch relations unless the recipe is being deleted"""
+
+        queryset = super().get_queryset()
+        if self.request.method != "DELETE":
+            queryset = queryset.prefetch_related("tags", "ingredients")
+
+        return queryset
+
+
+class RecipeImageUploadView(RecipeViewMixin, generics.GenericAPIView):
+    """Upload an image to a recipe"""
+
+    serializer_class = serializers.RecipeImageSerializer
+    parser_classes = [MultiPartParser]
+
+    def post(self, request, pk=None, format=None):
         """Upload image to recipe"""
         recipe = self.get_object()
         serializer = self.get_serializer(recipe, data=request.data)
@@ -124,8 +200,11 @@ class BaseRecipeAttrViewSet(
 ):
     """Base class for recipe attributes view set"""
 
-    authentication_classes = [TokenAuthentication]
+    authentication_classes = [CachedTokenAuthentication]
     permission_classes = [permissions.IsAuthenticated]
+    # Recipe through model and its column pointing at this attribute
+    recipe_through = None
+    recipe_through_field = None
 
     def get_queryset(self):
         """Filter tags for authenticated user only"""
@@ -138,15 +217,17 @@ class BaseRecipeAttrViewSet(
 
         queryset = self.queryset
         if assigned_only:
-            queryset = queryset.filter(recipe__isnull=False)
-
-        return (
-            queryset.filter(
-                user=self.request.user,
+            queryset = queryset.filter(
+                Exists(
+                    self.recipe_through.objects.filter(
+                        **{self.recipe_through_field: OuterRef("pk")},
+                    )
+                )
             )
-            .order_by("-name")
-            .distinct()
-        )
+
+        return queryset.filter(
+            user=self.request.user,
+        ).order_by("-name")
 
 
 class TagViewSet(BaseRecipeAttrViewSet):
@@ -154,6 +235,8 @@ class TagViewSet(BaseRecipeAttrViewSet):
 
     serializer_class = serializers.TagSerializer
     queryset = Tag.objects.all()
+    recipe_through = Recipe.tags.through
+    recipe_through_field = "tag_id"
 
 
 class IngredientViewSet(BaseRecipeAttrViewSet):
@@ -161,3 +244,5 @@ class IngredientViewSet(BaseRecipeAttrViewSet):
 
     serializer_class = serializers.IngredientSerializer
     queryset = Ingredient.objects.all()
+    recipe_through = Recipe.ingredients.through
+    recipe_through_field = "ingredient_id"
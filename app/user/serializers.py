@@ -5,29 +5,38 @@ from rest_framework import serializers
 from django.utils.translation import gettext_lazy as _
 
 
+User = get_user_model()
+
+
 class UserSerializer(serializers.ModelSerializer):
     """Serializer for the user object"""
 
     class Meta:
-        model = get_user_model()
+        model = User
         fields = ["email", "password", "name"]
         extra_kwargs = {"password": {"write_only": True, "min_length": 5}}
 
     def create(self, validated_data):
         """Create and return user with secured/encrypted password"""
-        return get_user_model().objects.create_user(**validated_data)
+        return User.objects.create_user(**validated_data)
 
     def update(self, instance, validated_data):
         """Update and return user profile"""
 
         password = validated_data.pop("password", None)
-        user = super().update(instance, validated_data)
+
+        for attr, value in validated_data.items():
+            setattr(instance, attr, value)
+        update_fields = list(validated_data)
 
         if password:
-            user.set_password(password)
-            user.save()
+            instance.set_password(password)
+            update_fields.append("password")
+
+        if update_fields:
+            instance.save(update_fields=update_fields)
 
-        return user
+        return instance
 
 
 class AuthenticationSerializer(serializers.Serializer):
@@ -45,7 +54,7 @@ class AuthenticationSerializer(serializers.Serializer):
         password = attrs.get("password")
 
         user = authenticate(
-            request=self.context.get("requets"),
+            request=self.context.get("request"),
             username=email,
             password=password,  # noqa
         )
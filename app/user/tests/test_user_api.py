@@ -23,8 +23,7 @@ def create_user(**params):
 class PublicUserAPiTest(TestCase):
     """Test the public features of the user api"""
 
-    def setUp(self):
-        self.client = APIClient()
+    client_class = APIClient
 
     def test_create_user_success(self):
         """Test creating user is successful"""
@@ -138,13 +137,17 @@ class PublicUserAPiTest(TestCase):
 class PrivateUserApiTests(TestCase):
     """Test API for authenticated user"""
 
-    def setUp(self):
-        self.user = create_user(
+    client_class = APIClient
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = create_user(
             email="test@example.com",
             password="testpassword123_",
             name="test name",
         )
-        self.client = APIClient()
+
+    def setUp(self):
         self.client.force_authenticate(user=self.user)
 
     def test_retrieve_user_profile_success(self):
@@ -182,7 +185,8 @@ class PrivateUserApiTests(TestCase):
             "password": "newpassword",
         }
 
-        response = self.client.patch(ME_URL, payload)
+        with self.assertNumQueries(1):
+            response = self.client.patch(ME_URL, payload)
 
         self.user.refresh_from_db()
         self.assertEqual(self.user.name, payload["name"])